@@ -1,13 +1,21 @@
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+import functools
 import os
 from pathlib import Path
-import numpy as np
 import argparse
 
+# pyarrow's multi-threaded CSV reader is used when it is installed
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+
+@functools.lru_cache(maxsize=None)
 def find_project_root(start: Path) -> Path:
-    """Finds the project root by looking for a .git directory."""
+    """Finds the project root from $PROJECT_ROOT, or by looking for a .git directory."""
+    if 'PROJECT_ROOT' in os.environ:
+        return Path(os.environ['PROJECT_ROOT'])
     for parent in [start] + list(start.parents):
         if (parent / ".git").exists():
             return parent
@@ -23,26 +31,34 @@ except (FileNotFoundError, NameError):
 # Define the output folder within the project structure
 output_folder = PROJECT_ROOT / 'results/graphs'
 
-def create_graphs_folder():
-    """Creates the 'graphs' folder if it doesn't already exist."""
-    os.makedirs(output_folder, exist_ok=True)
-    print(f"Ensured output folder exists: {output_folder}")
+# Column types applied by the CSV parser, so no post-load coercion pass is needed.
+# Timings are only plotted, so float32 is ample and halves the bytes scanned; core counts fit Int16,
+# while colors_removed stays Int32 as it can reach MAX_N^3 for the largest boards.
+NA_VALUES = ['N/A', 'inf', 'NA']
+COLUMN_DTYPES = {
+    'num_processors': 'Int16', 'num_threads': 'Int16', 'task_factor': 'float32',
+    'solving_time': 'float32', 'total_time': 'float32', 'speedup': 'float32',
+    'efficiency': 'float32', 'colors_removed': 'Int32'
+}
+
+def read_results_csv(results_file):
+    """Reads the results CSV with typed columns, preferring the pyarrow engine."""
+    if CSV_ENGINE == 'pyarrow':
+        # The pyarrow engine does not apply nullable dtypes at parse time, so cast afterwards;
+        # like the dtype map of the C engine, columns missing from the file are skipped.
+        df = pd.read_csv(results_file, na_values=NA_VALUES, engine='pyarrow')
+        return df.astype({col: dtype for col, dtype in COLUMN_DTYPES.items() if col in df.columns})
+    return pd.read_csv(results_file, na_values=NA_VALUES, dtype=COLUMN_DTYPES)
 
 def clean_data(df):
     """
-    Cleans and prepares the DataFrame by handling missing values and converting types.
+    Drops rows missing the fields required for plotting.
+    Missing values and column types are already handled by read_csv (see COLUMN_DTYPES).
     """
-    df.replace(['N/A', 'inf'], pd.NA, inplace=True)
-    numeric_cols = [
-        'num_processors', 'num_threads', 'task_factor',
-        'solving_time', 'total_time', 'speedup', 'efficiency',
-        'colors_removed'
-    ]
-    for col in numeric_cols:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
-            
     df.dropna(subset=['puzzle_name', 'implementation', 'total_time'], inplace=True)
+    # Low-cardinality labels: categorical codes make filtering and grouping integer compares
+    for col in ('puzzle_name', 'implementation'):
+        df[col] = df[col].astype('category')
     return df
 
 def plot_precoloring_total_time_comparison(df, save_path, dimension=None):
@@ -54,6 +70,13 @@ def plot_precoloring_total_time_comparison(df, save_path, dimension=None):
         save_path (Path): The Path object for the output folder.
         dimension (int, optional): The puzzle dimension to filter for (e.g., 9 for 9x9).
     """
+    # Imported here so that importing the module (e.g. for clean_data) skips matplotlib startup.
+    # Output is always a PDF file, so the non-interactive Agg backend avoids GUI backend discovery.
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     print("\n--- Generating Plot ---")
 
     # Set Custom Plot Style using rcParams
@@ -67,48 +90,54 @@ def plot_precoloring_total_time_comparison(df, save_path, dimension=None):
         'legend.fontsize': 7,
         'lines.linewidth': 1,
         'lines.markersize': 2.6,
-        'savefig.bbox': 'tight'
+        'savefig.bbox': 'tight',
+        'pdf.fonttype': 42,  # embed TrueType fonts instead of Type 3 conversions
+        'pdf.compression': 9
     })
 
     # 1. Filter and prepare data
-    seq_df = df[df['implementation'] == 'seq'].copy()
-    seq_df = seq_df[seq_df['total_time'] > 0]
-    if 'colors_removed' not in seq_df.columns:
+    if 'colors_removed' not in df.columns:
         print("Error: 'colors_removed' column not found.")
         plt.rcdefaults()
         return
 
-    # Clean puzzle names FIRST
-    seq_df['puzzle_name'] = seq_df['puzzle_name'].apply(os.path.basename).str.replace('.txt', '', regex=False)
+    # Clean puzzle names FIRST (on a categorical column this runs once per category)
+    puzzle_names = df['puzzle_name'].str.rsplit('/', n=1).str[-1].str.removesuffix('.txt')
 
-    # Conditionally filter by dimension
+    # Build one mask for all filters, then select and project the needed columns in a single pass
+    mask = (df['implementation'] == 'seq') & (df['total_time'] > 0)
     if dimension:
         pattern = f"{dimension}x{dimension}"
         print(f"Filtering for puzzles starting with '{pattern}'...")
-        seq_df = seq_df[seq_df['puzzle_name'].str.startswith(pattern)]
+        mask &= puzzle_names.str.startswith(pattern)
     else:
         print("No dimension provided. Using all sequential puzzles.")
 
+    seq_df = df.loc[mask, ['total_time', 'colors_removed']].copy()
+    seq_df['puzzle_name'] = puzzle_names[mask]
+
     if seq_df.empty:
         print("No data found for the specified criteria. Skipping plot generation.")
         plt.rcdefaults()
         return
 
     seq_df['colors_removed'] = seq_df['colors_removed'].fillna(0)
-    seq_df['Pre-coloring Status'] = np.where(
-        seq_df['colors_removed'] > 0,
-        'With Pre-coloring',
-        'Without Pre-coloring'
+    seq_df['Pre-coloring Status'] = pd.Categorical.from_codes(
+        (seq_df['colors_removed'] > 0).to_numpy(dtype='int8'),
+        categories=['Without Pre-coloring', 'With Pre-coloring']
     )
 
     # --- Plot Generation ---
     fig, ax = plt.subplots()
-    barplot = sns.barplot(
+    sns.barplot(
         ax=ax,
         data=seq_df,
         x='puzzle_name',
         y='total_time',
         hue='Pre-coloring Status',
+        # Only the statuses present, in order of appearance: an unused category would get an
+        # empty legend entry and halve the bar width
+        hue_order=seq_df['Pre-coloring Status'].unique().tolist(),
         palette={'Without Pre-coloring': 'skyblue', 'With Pre-coloring': 'coral'}
     )
 
@@ -123,18 +152,16 @@ def plot_precoloring_total_time_comparison(df, save_path, dimension=None):
     ymin, ymax = ax.get_ylim()
     ax.set_ylim(ymin, ymax * 3)
 
-    for p in barplot.patches:
-        if p.get_height() > 0:
-            barplot.annotate(format(p.get_height(), '.1f'),
-                           (p.get_x() + p.get_width() / 2., p.get_height()),
-                           ha='center', va='center',
-                           xytext=(0, 4), textcoords='offset points', fontsize=5)
+    # Labels are anchored at their bottom edge, so padding=2 keeps them where the old centred 4pt offset put them
+    for container in ax.containers:
+        ax.bar_label(container, fmt='%.1f', padding=2, fontsize=5, label_type='edge')
 
     # --- Save the Plot to File with a dynamic name ---
     filename_suffix = f"{dimension}x{dimension}" if dimension else "all_puzzles"
     output_filename = save_path / f'precoloring_comparison_{filename_suffix}.pdf'
     
-    plt.savefig(output_filename, dpi=300)
+    # Bars are vector artists, so dpi has no effect; a fixed CreationDate keeps the PDF reproducible
+    fig.savefig(output_filename, metadata={'CreationDate': None})
     plt.close(fig)
     plt.rcdefaults()
     
@@ -146,12 +173,13 @@ def main(dimension_arg):
     results_file = PROJECT_ROOT / 'results/results_dataset.csv'
     
     try:
-        df_raw = pd.read_csv(results_file)
+        df_raw = read_results_csv(results_file)
     except FileNotFoundError:
         print(f"Error: '{results_file}' not found. Please ensure the CSV file is present.")
         return
 
-    create_graphs_folder()
+    output_folder.mkdir(parents=True, exist_ok=True)
+    print(f"Ensured output folder exists: {output_folder}")
     df_cleaned = clean_data(df_raw)
 
     # Pass the dimension argument to the plotting function
@@ -1,131 +1,243 @@
+import io
 import re
-import csv
 import os
+import mmap
+import hashlib
 import argparse
+import functools
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
+# pyarrow's C++ CSV reader is used for the master CSV when it is installed,
+# and a typed Parquet copy of the dataset is written alongside it
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+@functools.cache
 def find_project_root(start: Path) -> Path:
-    for parent in [start] + list(start.parents):
-        if (parent / ".git").exists():
-            return parent
-    raise FileNotFoundError("Project root not found")
+    """Finds the project root from $PROJECT_ROOT, or by looking for a .git entry."""
+    if 'PROJECT_ROOT' in os.environ:
+        return Path(os.environ['PROJECT_ROOT'])
+    # Plain string paths: one stat per level and no Path objects built along the way
+    parent = str(start)
+    while True:
+        if os.path.exists(os.path.join(parent, ".git")):
+            return Path(parent)
+        parent, previous = os.path.dirname(parent), parent
+        if parent == previous:
+            raise FileNotFoundError("Project root not found")
 
 PROJECT_ROOT = find_project_root(Path(__file__).resolve().parent)
 output_folder = PROJECT_ROOT / 'results'
 
-def _parse_single_run_block(block_content, job_id_from_file=None, file_path=None):
+# --- Regex patterns to find the data ---
+# Logs are scanned as raw bytes straight from an mmap; only the captured values are decoded.
+_FIELD_PATTERNS = {
+    'puzzle_name': rb"Puzzle(?: file)?: (.+)",
+    'task_factor': rb"\* ([\d.]+) factor",
+    'depth': rb"Chosen depth: (\d+)",
+    'work_units': rb"Generated (\d+) work units",
+    'colors_removed': rb"Colors removed by pre-coloring: (\d+)",
+    'colors_remaining': rb"Colors remaining: (\d+)",
+    'space_reduction': rb"Search space reduction: ([\d.]+)%",
+    'solving_time': rb"Solving phase:\s+([\d.]+) seconds",
+    'total_time': rb"Total time:\s+([\d.]+) seconds"
+}
+
+# Header and core-count lines, captured in the same pass but not written out as fields
+_AUX_PATTERNS = {
+    'header': rb"Futoshiki (MPI Parallel|OpenMP Parallel|Sequential|Hybrid) Solver",
+    'processes': rb"Running with (\d+) process",
+    'omp_threads': rb"Running with (\d+) OpenMP thread",
+    'hybrid_threads': rb"and (\d+) OpenMP thread\(s\) per process"
+}
+
+_HEADER_IMPLEMENTATIONS = {
+    'MPI Parallel': 'mpi', 'OpenMP Parallel': 'omp', 'Sequential': 'seq', 'Hybrid': 'hybrid'
+}
+
+# Fields printed by print_stats, which follow the "Color Statistics:" line at the end of a run
+_STATS_FIELDS = ('colors_removed', 'colors_remaining', 'space_reduction', 'solving_time', 'total_time')
+
+def _combine(patterns):
     """
-    Parses a single block of text corresponding to one solver run.
+    Combines patterns into one alternation of named groups, so a region is scanned once.
+    Each pattern's value is the capture group directly after its named group.
     """
-    data = {}
-
-    # Determine test_type from filename
-    if file_path:
-        filename = os.path.basename(file_path).lower()
-        if 'scaling' in filename:
-            data['test_type'] = 'scaling'
-        elif 'factor' in filename:
-            data['test_type'] = 'factor'
-        else:
-            data['test_type'] = 'single'
-    else:
-        data['test_type'] = 'N/A'
+    return re.compile(b"|".join(
+        b"(?P<" + key.encode() + b">" + pattern + b")" for key, pattern in patterns.items()
+    ))
+
+# Each region of a block is only scanned for the lines that can appear in it
+_CONFIG_RE = _combine({**{k: v for k, v in _FIELD_PATTERNS.items() if k not in _STATS_FIELDS}, **_AUX_PATTERNS})
+_STATS_RE = _combine({k: _FIELD_PATTERNS[k] for k in _STATS_FIELDS})
+
+_JOB_ID_RE = re.compile(rb"Job ID: (\d+)")
+# Bytes are not newline-translated, so tolerate CRLF line endings explicitly
+_RUN_START_RE = re.compile(
+    rb"^(?:\[INFO\](?:\[RANK \d+\])?\s*)?={10,}\r?\n"
+    rb"^(?:\[INFO\](?:\[RANK \d+\])?\s*)?Futoshiki.*?Solver\r?\n"
+    rb"^(?:\[INFO\](?:\[RANK \d+\])?\s*)?={10,}",
+    re.MULTILINE
+)
+# Literal prefix of the banner's '=' rule lines, used to locate candidate run starts
+_RULE = b"=" * 10
+
+# Raw log contents: the mmap of a log file, or bytes
+Buffer = bytes | mmap.mmap
+
+def _decode(value: bytes) -> str:
+    """Decodes a captured log fragment to a stripped str."""
+    return value.decode('utf-8', errors='replace').strip()
+
+# (num_processors, num_threads) for each implementation, from the values found in its block
+_IMPL_RULES = {
+    'mpi': lambda found: (found.get('processes', '1'), '1'),
+    'omp': lambda found: ('1', found.get('omp_threads', '1')),
+    'seq': lambda found: ('1', '1'),
+    'hybrid': lambda found: (found.get('processes', 'N/A'), found.get('hybrid_threads', 'N/A')),
+}
+
+def _unknown_impl_rule(found: dict[str, str]) -> tuple[str, str]:
+    return 'N/A', 'N/A'
+
+def _test_type_from_filename(file_path: str | os.PathLike | None) -> str:
+    """Determines the test_type of every run in a log from the log's filename."""
+    if not file_path:
+        return 'N/A'
+    filename = os.path.basename(file_path).lower()
+    if 'scaling' in filename:
+        return 'scaling'
+    elif 'factor' in filename:
+        return 'factor'
+    return 'single'
+
+def _parse_single_run_block(content: Buffer, start: int, end: int,
+                            job_id_from_file: str | None = None, test_type: str = 'N/A') -> dict[str, str]:
+    """
+    Parses the run block content[start:end] corresponding to one solver run.
+    The block is scanned once, in place via pos/endpos rather than sliced out of the file:
+    the run configuration up to the statistics section, and the statistics after it.
+    """
+    data: dict[str, str] = {'test_type': test_type}
+
+    # Without a statistics section both scans fall back to the whole block
+    stats_start = content.rfind(b"Color Statistics:", start, end)
+    config_end = end if stats_start == -1 else stats_start
+
+    # Keep the first occurrence of each pattern, as a per-pattern search would;
+    # repeats (e.g. the same line from several ranks) are skipped without being decoded
+    found: dict[str, str] = {}
+    for regex, pos, endpos in ((_CONFIG_RE, start, config_end), (_STATS_RE, max(stats_start, start), end)):
+        for match in regex.finditer(content, pos, endpos):
+            # Every alternative is a named group around its pattern, so a match always sets both
+            name, index = match.lastgroup, match.lastindex
+            assert name is not None and index is not None
+            if name not in found:
+                found[name] = _decode(match.group(index + 1))
+    get = found.get
 
     # Determine the implementation type from the header
-    if 'Futoshiki MPI Parallel Solver' in block_content:
-        data['implementation'] = 'mpi'
-    elif 'Futoshiki OpenMP Parallel Solver' in block_content:
-        data['implementation'] = 'omp'
-    elif 'Futoshiki Sequential Solver' in block_content:
-        data['implementation'] = 'seq'
-    elif 'Futoshiki Hybrid Solver' in block_content:
-        data['implementation'] = 'hybrid'
-    else:
-        data['implementation'] = 'unknown'
-
-    # --- Regex patterns to find the data ---
-    patterns = {
-        'puzzle_name': r"Puzzle(?: file)?: (.+)",
-        'task_factor': r"\* ([\d.]+) factor",
-        'depth': r"Chosen depth: (\d+)",
-        'work_units': r"Generated (\d+) work units",
-        'colors_removed': r"Colors removed by pre-coloring: (\d+)",
-        'colors_remaining': r"Colors remaining: (\d+)",
-        'space_reduction': r"Search space reduction: ([\d.]+)%",
-        'solving_time': r"Solving phase:\s+([\d.]+) seconds",
-        'total_time': r"Total time:\s+([\d.]+) seconds"
-    }
-
-    for key, pattern in patterns.items():
-        match = re.search(pattern, block_content)
-        data[key] = match.group(1).strip() if match else 'N/A'
+    data['implementation'] = _HEADER_IMPLEMENTATIONS.get(get('header', ''), 'unknown')
+
+    for key in _FIELD_PATTERNS:
+        data[key] = get(key, 'N/A')
 
     # --- Specific patterns for Processors and Threads ---
-    if data['implementation'] == 'mpi':
-        match = re.search(r"Running with (\d+) process", block_content)
-        data['num_processors'] = match.group(1).strip() if match else '1'
-        data['num_threads'] = '1'
-    elif data['implementation'] == 'omp':
-        match = re.search(r"Running with (\d+) OpenMP thread", block_content)
-        data['num_threads'] = match.group(1).strip() if match else '1'
-        data['num_processors'] = '1'
-    elif data['implementation'] == 'seq':
-        data['num_processors'] = '1'
-        data['num_threads'] = '1'
-    elif data['implementation'] == 'hybrid':
-         proc_match = re.search(r"Running with (\d+) process", block_content)
-         thread_match = re.search(r"and (\d+) OpenMP thread\(s\) per process", block_content)
-         data['num_processors'] = proc_match.group(1).strip() if proc_match else 'N/A'
-         data['num_threads'] = thread_match.group(1).strip() if thread_match else 'N/A'
-    else:
-        data['num_processors'] = 'N/A'
-        data['num_threads'] = 'N/A'
+    rule = _IMPL_RULES.get(data['implementation'], _unknown_impl_rule)
+    data['num_processors'], data['num_threads'] = rule(found)
     
     data['job_id'] = job_id_from_file if job_id_from_file else 'N/A'
     return data
 
-def parse_runs_from_file(file_path):
+def parse_runs_from_file(file_path: str | os.PathLike) -> list[dict[str, str]]:
     """
     Parses a log file that may contain multiple solver runs using a robust block-finding strategy.
+    The file is memory-mapped, so its pages are searched in place rather than copied and decoded.
     """
     try:
-        with open(file_path, 'r') as f:
-            content = f.read()
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return []
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                # The log is scanned front to back, so let the kernel read ahead aggressively
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    content.madvise(mmap.MADV_SEQUENTIAL)
+                return _parse_runs_from_content(content, file_path)
     except Exception as e:
         print(f"Error reading file '{os.path.basename(file_path)}': {e}")
         return []
 
-    job_id_match = re.search(r"Job ID: (\d+)", content)
-    file_level_job_id = job_id_match.group(1).strip() if job_id_match else None
+def _find_run_starts(content: Buffer) -> list[int]:
+    """
+    Returns the offsets of all run-start banners in the log.
+    Candidate lines are located with a plain substring search for the '=' rule, and the
+    banner regex is only tried at the start of those lines instead of at every line start.
+    """
+    # Method lookups are bound once outside the loop
+    find, rfind, match_banner = content.find, content.rfind, _RUN_START_RE.match
+    starts: list[int] = []
+    pos = find(_RULE)
+    while pos != -1:
+        line_start = rfind(b"\n", 0, pos) + 1
+        match = match_banner(content, line_start)
+        if match:
+            starts.append(line_start)
+            resume = match.end()
+        else:
+            resume = find(b"\n", pos)
+            if resume == -1:
+                break
+        pos = find(_RULE, resume)
+    return starts
 
-    run_start_pattern = re.compile(
-        r"^(?:\[INFO\](?:\[RANK \d+\])?\s*)?={10,}\n"
-        r"^(?:\[INFO\](?:\[RANK \d+\])?\s*)?Futoshiki.*?Solver\n"
-        r"^(?:\[INFO\](?:\[RANK \d+\])?\s*)?={10,}",
-        re.MULTILINE
-    )
-    
-    start_matches = list(run_start_pattern.finditer(content))
-    if not start_matches:
+def _parse_runs_from_content(content: Buffer, file_path: str | os.PathLike) -> list[dict[str, str]]:
+    """
+    Splits the raw log bytes into run blocks and parses each completed run.
+    """
+    job_id_match = _JOB_ID_RE.search(content)
+    file_level_job_id = _decode(job_id_match.group(1)) if job_id_match else None
+
+    run_starts = _find_run_starts(content)
+    if not run_starts:
         return []
 
-    parsed_runs = []
-    for i, start_match in enumerate(start_matches):
-        start_pos = start_match.start()
-        end_pos = start_matches[i + 1].start() if i + 1 < len(start_matches) else len(content)
-        block = content[start_pos:end_pos]
+    # Per-file values are computed once, not for every run block
+    test_type = _test_type_from_filename(file_path)
+    parsed_runs: list[dict[str, str]] = []
+    for i, start_pos in enumerate(run_starts):
+        end_pos = run_starts[i + 1] if i + 1 < len(run_starts) else len(content)
 
-        if "Time Distribution" not in block:
+        # Only completed runs print the distribution, at the end of the block, so search backwards
+        if content.rfind(b"Time Distribution", start_pos, end_pos) == -1:
             continue
-                
-        if block.strip():
-            # Pass file_path to the parsing function to determine the test_type
-            run_data = _parse_single_run_block(block, file_level_job_id, file_path)
-            parsed_runs.append(run_data)
+
+        run_data = _parse_single_run_block(content, start_pos, end_pos, file_level_job_id, test_type)
+        parsed_runs.append(run_data)
             
     return parsed_runs
 
+def _parse_files(files, workers):
+    """
+    Yields the runs parsed from each file, in input order. Files are independent, so with
+    more than one worker they are parsed in a process pool and handed out in chunks of up to
+    8 to amortise the pickling round-trips, while keeping enough chunks to balance the load.
+    """
+    if workers <= 1:
+        yield from map(parse_runs_from_file, files)
+        return
+    chunksize = max(1, min(8, len(files) // (4 * workers)))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(parse_runs_from_file, files, chunksize=chunksize)
+
 def save_as_formatted_text(data_list, input_path):
     """
     Saves the extracted data from one or more runs to a single text file.
@@ -140,110 +252,146 @@ def save_as_formatted_text(data_list, input_path):
     full_output_path = os.path.join(output_dir, output_filename)
     print(f"  -> Saving formatted text summary to: {full_output_path}")
 
+    # Build the whole summary in memory and hand it to the file in one write
+    parts = [
+        f"Source File: {base_name}\nGenerated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+        f"Total Runs Found: {len(data_list)}\n",
+    ]
+    rule = "=" * 20
+    for i, data in enumerate(data_list, 1):
+        parts.append(
+            f"\n{rule} RUN {i} {rule}\n"
+            "--- Run Configuration ---\n"
+            f"  Puzzle Name:         {data['puzzle_name']}\n"
+            f"  Test Type:           {data['test_type']}\n"
+            f"  Implementation:      {data['implementation'].upper()}\n"
+            f"  Job ID:              {data['job_id']}\n"
+            f"  MPI Processes:       {data['num_processors']}\n"
+            f"  OMP Threads:         {data['num_threads']}\n\n"
+            "--- Performance Metrics ---\n"
+            f"  Total Time:          {data['total_time']} seconds\n"
+            f"  Speedup:             {data.get('speedup', 'N/A')}\n"
+            f"  Efficiency:          {data.get('efficiency', 'N/A')}\n"
+        )
+    parts.append("=" * 50 + "\n")
+
     with open(full_output_path, 'w') as f:
-        f.write(f"Source File: {base_name}\nGenerated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"Total Runs Found: {len(data_list)}\n")
-        
-        for i, data in enumerate(data_list, 1):
-            f.write("\n" + "="*20 + f" RUN {i} " + "="*20 + "\n")
-            f.write("--- Run Configuration ---\n")
-            f.write(f"  Puzzle Name:         {data['puzzle_name']}\n")
-            f.write(f"  Test Type:           {data['test_type']}\n")
-            f.write(f"  Implementation:      {data['implementation'].upper()}\n")
-            f.write(f"  Job ID:              {data['job_id']}\n")
-            f.write(f"  MPI Processes:       {data['num_processors']}\n")
-            f.write(f"  OMP Threads:         {data['num_threads']}\n\n")
-            f.write("--- Performance Metrics ---\n")
-            f.write(f"  Total Time:          {data['total_time']} seconds\n")
-            f.write(f"  Speedup:             {data.get('speedup', 'N/A')}\n")
-            f.write(f"  Efficiency:          {data.get('efficiency', 'N/A')}\n")
-        f.write("="*50 + "\n")
+        f.write(''.join(parts))
+
+CSV_HEADER = [
+    'puzzle_name', 'implementation', 'test_type', 'job_id', 'num_processors', 
+    'num_threads', 'task_factor', 'depth', 'work_units', 
+    'colors_removed', 'colors_remaining', 'space_reduction', 
+    'solving_time', 'total_time', 'speedup', 'efficiency'
+]
+
+# Value types of the numeric columns in the Parquet sidecar; 'N/A' becomes null
+_INTEGER_COLUMNS = ['num_processors', 'num_threads', 'depth', 'work_units', 'colors_removed', 'colors_remaining']
+_FLOAT_COLUMNS = ['task_factor', 'space_reduction', 'solving_time', 'total_time', 'speedup', 'efficiency']
+
+# Key in the attrs of a frame read from the CSV holding the blake2b digest of the file's bytes
+_CSV_DIGEST = 'csv_blake2b'
+
+def _parquet_path(csv_path):
+    """Path of the typed Parquet copy of the master CSV."""
+    return os.path.splitext(csv_path)[0] + '.parquet'
+
+def _write_parquet_sidecar(df, csv_path):
+    """
+    Writes the dataset as Parquet with numeric columns stored as numbers, so readers
+    get typed columns without parsing strings. Skipped when pyarrow is not installed.
+    """
+    if pa is None:
+        return
+    typed = df[CSV_HEADER].replace('N/A', None)
+    for column in _INTEGER_COLUMNS:
+        typed[column] = pd.to_numeric(typed[column], errors='coerce').astype('Int64')
+    for column in _FLOAT_COLUMNS:
+        typed[column] = pd.to_numeric(typed[column], errors='coerce')
+    pq.write_table(pa.Table.from_pandas(typed, preserve_index=False), _parquet_path(csv_path))
+
+def _read_results_frame(csv_path):
+    """
+    Reads the master CSV into a DataFrame with every value kept as a string.
+    The file is read once; the digest of its bytes is kept in the frame's attrs.
+    """
+    with open(csv_path, 'rb') as f:
+        raw = f.read()
+    if pa is not None:
+        convert_options = pa_csv.ConvertOptions(column_types={h: pa.string() for h in CSV_HEADER})
+        df = pa_csv.read_csv(pa.BufferReader(raw), convert_options=convert_options).to_pandas()
+    else:
+        df = pd.read_csv(io.BytesIO(raw), dtype=str, keep_default_na=False)
+    df.attrs[_CSV_DIGEST] = hashlib.blake2b(raw).hexdigest()
+    return df
 
 def update_results_csv(newly_parsed_data, csv_path):
     """
     Reads, updates, calculates, and overwrites the master CSV file.
     """
-    key_columns = ('puzzle_name', 'implementation', 'test_type', 'job_id', 'num_processors', 'num_threads', 'task_factor')
+    key_columns = ['puzzle_name', 'implementation', 'test_type', 'job_id', 'num_processors', 'num_threads', 'task_factor']
     
-    all_records = {}
+    def keyed(frame):
+        # As with the previous dict-based merge, a repeated key keeps the values of its last row
+        # at the position where it was first seen
+        return frame.reindex(columns=CSV_HEADER).fillna('N/A').groupby(key_columns, sort=False).last()
+
+    df = keyed(pd.DataFrame(newly_parsed_data, columns=CSV_HEADER))
+    previous_digest = None
     if os.path.isfile(csv_path):
         try:
-            with open(csv_path, 'r', newline='') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    record_key = tuple(row.get(k, 'N/A') for k in key_columns)
-                    all_records[record_key] = row
+            previous = _read_results_frame(csv_path)
+            previous_digest = previous.attrs[_CSV_DIGEST]
+            existing = keyed(previous)
+            # Keyed join in dict order: newly parsed runs replace existing records with the same
+            # key in place, and the remaining new runs are appended after the existing records
+            merged = existing.reindex(existing.index.union(df.index, sort=False))
+            merged.update(df)
+            df = merged
         except Exception as e:
             print(f"Warning: Could not read existing CSV file. A new one will be created. Error: {e}")
-
-    for data in newly_parsed_data:
-        record_key = tuple(data.get(k, 'N/A') for k in key_columns)
-        all_records[record_key] = data
+    df = df.reset_index()
 
     # Find baseline sequential run times for each puzzle
-    sequential_times = {}
-    for record in all_records.values():
-        if record.get('implementation') == 'seq' and record.get('total_time') != 'N/A':
-            try:
-                seq_time = float(record['total_time'])
-                sequential_times[record['puzzle_name']] = seq_time
-            except (ValueError, TypeError):
-                continue
-
-    final_data_list = []
-    for record in all_records.values():
-        puzzle_name = record.get('puzzle_name')
-        impl = record.get('implementation')
-        
-        record['speedup'] = 'N/A'
-        record['efficiency'] = 'N/A'
-
-        if impl != 'seq' and puzzle_name in sequential_times:
-            try:
-                parallel_time = float(record.get('total_time'))
-                seq_time = sequential_times[puzzle_name]
-
-                if parallel_time > 0:
-                    speedup = seq_time / parallel_time
-                    record['speedup'] = f"{speedup:.4f}"
-                    
-                    procs = int(record.get('num_processors', 1))
-                    threads = int(record.get('num_threads', 1))
-                    
-                    total_cores = 1
-                    if impl == 'mpi': total_cores = procs
-                    elif impl == 'omp': total_cores = threads
-                    elif impl == 'hybrid': total_cores = procs * threads
-                    
-                    if total_cores > 0:
-                        efficiency = speedup / total_cores
-                        record['efficiency'] = f"{efficiency:.4f}"
-            except (ValueError, TypeError, ZeroDivisionError):
-                continue
-        
-        final_data_list.append(record)
+    impl = df['implementation']
+    total_time = pd.to_numeric(df['total_time'], errors='coerce')
+    is_seq = impl == 'seq'
+    sequential_times = total_time[is_seq].groupby(df.loc[is_seq, 'puzzle_name']).last()
+
+    seq_time = df['puzzle_name'].map(sequential_times)
+    speedup = (seq_time / total_time).where(~is_seq & (total_time > 0))
+
+    procs = pd.to_numeric(df['num_processors'], errors='coerce')
+    threads = pd.to_numeric(df['num_threads'], errors='coerce')
+    total_cores = np.select(
+        [impl == 'mpi', impl == 'omp', impl == 'hybrid'],
+        [procs, threads, procs * threads],
+        default=1
+    )
+    efficiency = (speedup / total_cores).where(total_cores > 0)
+
+    df['speedup'] = speedup.map('{:.4f}'.format, na_action='ignore').fillna('N/A')
+    df['efficiency'] = efficiency.map('{:.4f}'.format, na_action='ignore').fillna('N/A')
 
-    header = [
-        'puzzle_name', 'implementation', 'test_type', 'job_id', 'num_processors', 
-        'num_threads', 'task_factor', 'depth', 'work_units', 
-        'colors_removed', 'colors_remaining', 'space_reduction', 
-        'solving_time', 'total_time', 'speedup', 'efficiency'
-    ]
-    
     try:
         os.makedirs(os.path.dirname(csv_path), exist_ok=True)
-        with open(csv_path, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=header, extrasaction='ignore')
-            writer.writeheader()
-            final_data_list.sort(key=lambda r: (
-                r.get('puzzle_name', ''), 
-                r.get('test_type', ''),
-                r.get('implementation', ''), 
-                int(r.get('num_processors', 1)), 
-                int(r.get('num_threads', 1))
-            ))
-            writer.writerows(final_data_list)
-        print(f"\nCSV Update Complete: '{csv_path}' has been updated with {len(final_data_list)} total records.")
+        # Sort on the numeric core counts already parsed above rather than converting them again
+        df = df.assign(_procs=procs, _threads=threads).sort_values(
+            ['puzzle_name', 'test_type', 'implementation', '_procs', '_threads'], kind='stable'
+        ).drop(columns=['_procs', '_threads'])
+        # CRLF line endings, as csv.DictWriter wrote them, keep existing files byte-for-byte stable
+        content = df.to_csv(index=False, columns=CSV_HEADER, lineterminator='\r\n').encode()
+        # Nothing is rewritten when the file on disk already holds exactly this CSV
+        if hashlib.blake2b(content).hexdigest() == previous_digest:
+            print(f"\nCSV Unchanged: '{csv_path}' already holds these {len(df)} total records.")
+            return
+        # Written beside the CSV and renamed over it, so a crash never leaves a partial file
+        tmp_path = csv_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, csv_path)
+        _write_parquet_sidecar(df, csv_path)
+        print(f"\nCSV Update Complete: '{csv_path}' has been updated with {len(df)} total records.")
     except Exception as e:
         print(f"\nError writing to CSV file: {e}")
 
@@ -251,26 +399,32 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser(description="Parse Futoshiki solver output and calculate performance.")
     parser.add_argument("path", help="Path to the solver's output log file or a directory of log files.")
     parser.add_argument("--csv", default=f"{output_folder}/results_dataset.csv", help="Path for the output CSV file.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Number of processes used to parse log files (default: CPU count).")
     args = parser.parse_args()
 
     input_path = Path(args.path)
-    files_to_process = []
+    files_to_process: list[Path] = []
 
     if not input_path.exists():
         print(f"Error: The path '{input_path}' does not exist."); exit(1)
 
     if input_path.is_dir():
-        files_to_process.extend(f for f in input_path.iterdir() if f.is_file())
+        # DirEntry.is_file() reuses the type from the directory listing instead of a stat per file
+        with os.scandir(input_path) as it:
+            files_to_process.extend(Path(entry.path) for entry in it if entry.is_file(follow_symlinks=False))
     else:
         files_to_process.append(input_path)
 
     if not files_to_process:
         print("No files found to process."); exit(0)
 
+    # A single file or --workers 1 is parsed in-process to skip the pool start-up cost
+    workers = max(1, min(args.workers or 1, len(files_to_process)))
+
+    # Summaries are written as each file's runs arrive, while the workers parse the rest
     all_newly_parsed_data = []
-    for file_path in files_to_process:
+    for file_path, runs_in_file in zip(files_to_process, _parse_files(files_to_process, workers)):
         print(f"\nParsing file: {file_path.name}...")
-        runs_in_file = parse_runs_from_file(file_path)
         if runs_in_file:
             print(f"  Found {len(runs_in_file)} run(s) in this file.")
             all_newly_parsed_data.extend(runs_in_file)
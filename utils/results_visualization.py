@@ -1,11 +1,24 @@
 import pandas as pd
-import matplotlib.pyplot as plt
+import matplotlib
+# Figures are only written to files, so they are drawn on an Agg canvas without pyplot
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import os
+import argparse
+import functools
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import numpy as np
 
+# pyarrow's multi-threaded CSV reader is used when it is installed
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+
 # Global Matplotlib style settings for LaTeX paper format
-plt.rcParams.update({
+matplotlib.rcParams.update({
     'figure.figsize': (3.5, 2.8), # Size for a two-column layout
     'font.size': 8,
     'axes.titlesize': 10,
@@ -35,19 +48,62 @@ except (FileNotFoundError, NameError):
     
 output_folder = PROJECT_ROOT / 'results/graphs'
 
-def create_graphs_folder():
-    """Creates the 'graphs' folder if it doesn't already exist."""
-    os.makedirs(output_folder, exist_ok=True)
-    print(f"Ensured output folder exists: {output_folder}")
+# Only the columns the plots and filters use are parsed; pre-coloring statistics are skipped.
+USE_COLUMNS = [
+    'puzzle_name', 'implementation', 'test_type', 'job_id', 'num_processors', 'num_threads',
+    'task_factor', 'solving_time', 'total_time', 'speedup', 'efficiency'
+]
+# Measurements are typed up front instead of inferred. Core counts are left to inference:
+# they become float only when a count is missing, and they are printed as tick labels.
+COLUMN_DTYPES = {
+    'task_factor': 'float64', 'solving_time': 'float64', 'total_time': 'float64',
+    'speedup': 'float64', 'efficiency': 'float64'
+}
+
+def _read_parquet_copy(parquet_file):
+    """
+    Reads the plotted columns from results_parser.py's typed Parquet copy of the CSV,
+    with the types read_csv would give them.
+    """
+    df = pd.read_parquet(parquet_file, columns=USE_COLUMNS)
+    # The copy stores job_id as text and core counts as nullable integers; like read_csv,
+    # keep them integer unless a value is missing
+    for col in ('job_id', 'num_processors', 'num_threads'):
+        values = df[col].astype('Int64')
+        df[col] = values.astype('float64' if values.hasnans else 'int64')
+    return df.astype(COLUMN_DTYPES)
+
+def read_results_csv(results_file):
+    """
+    Reads the columns of the results CSV used for plotting, preferring the pyarrow engine.
+    With pyarrow, the Parquet copy written beside the CSV is read instead while it is current.
+    """
+    if CSV_ENGINE == 'pyarrow':
+        parquet_file = results_file.with_suffix('.parquet')
+        try:
+            if parquet_file.stat().st_mtime >= results_file.stat().st_mtime:
+                return _read_parquet_copy(parquet_file)
+        except Exception:
+            pass  # Missing, stale or unreadable copy: fall back to parsing the CSV
+        # The pyarrow engine fails to apply a partial dtype map when an inferred integer column
+        # (job_id, a core count) has a missing value, so cast afterwards.
+        return pd.read_csv(results_file, usecols=USE_COLUMNS, engine='pyarrow').astype(COLUMN_DTYPES)
+    return pd.read_csv(results_file, usecols=USE_COLUMNS, dtype=COLUMN_DTYPES)
 
 def filter_by_job_id(df):
     """
     Filters out duplicate runs for the same configuration, keeping the one with the highest job_id.
     """
     print("Filtering duplicate runs, keeping latest job_id...")
-    df = df.sort_values('job_id', ascending=False)
     config_cols = ['puzzle_name', 'implementation', 'test_type', 'num_processors', 'num_threads', 'task_factor']
-    df_filtered = df.drop_duplicates(subset=config_cols, keep='first')
+    # Hash-group on the configuration instead of sorting the whole frame to find the latest run.
+    # A missing job_id only wins when its configuration has no other run; NaN keys form groups
+    # as drop_duplicates would treat them.
+    job_ids = df['job_id'].fillna(-np.inf)
+    latest = job_ids.groupby([df[col] for col in config_cols], sort=False, dropna=False, observed=True).idxmax()
+    # Only the kept runs are then ordered newest job first, as the rest of the script expects
+    # (e.g. _seq_time takes the first sequential run of a puzzle)
+    df_filtered = df[df.index.isin(latest)].sort_values('job_id', ascending=False, kind='stable')
     print(f"Removed {len(df) - len(df_filtered)} duplicate row(s).")
     return df_filtered
 
@@ -55,14 +111,27 @@ def clean_data(df):
     """
     Cleans and prepares the DataFrame by handling missing values and converting types.
     """
-    df.replace('N/A', pd.NA, inplace=True)
     numeric_cols = [
         'num_processors', 'num_threads', 'task_factor', 
         'solving_time', 'total_time', 'speedup', 'efficiency'
     ]
-    for col in numeric_cols:
-        df[col] = pd.to_numeric(df[col], errors='coerce')
-    df.dropna(subset=['puzzle_name', 'implementation', 'solving_time'], inplace=True)
+    # read_csv already maps 'N/A' to NaN and types the measurements (see COLUMN_DTYPES), so only
+    # a column that still came in as text needs coercing, all such columns in one pass
+    untyped = [col for col in numeric_cols if not pd.api.types.is_numeric_dtype(df[col])]
+    if untyped:
+        df[untyped] = df[untyped].apply(pd.to_numeric, errors='coerce')
+    df = df.dropna(subset=['puzzle_name', 'implementation', 'solving_time'])
+    # Low-cardinality labels used as filter and groupby keys: categorical codes hash and compare
+    # as integers. Every groupby passes observed=True so unused categories yield no empty groups.
+    df = df.astype({col: 'category' for col in ('puzzle_name', 'implementation', 'test_type')})
+
+    # Computed once at load for every plot: MPI counts processes, OpenMP threads, hybrid both;
+    # anything else is a single unit. isin on the categorical compares integer codes.
+    impl = df['implementation']
+    procs, threads = df['num_processors'].to_numpy(), df['num_threads'].to_numpy()
+    uses_procs = impl.isin(['mpi', 'hybrid']).to_numpy()
+    uses_threads = impl.isin(['omp', 'hybrid']).to_numpy()
+    df['computational_units'] = np.where(uses_procs, procs, 1) * np.where(uses_threads, threads, 1)
     return df
 
 def get_best_scaling_results(df, include_hybrid=False):
@@ -71,195 +140,262 @@ def get_best_scaling_results(df, include_hybrid=False):
     By default, it excludes hybrid data unless specified.
     """
     print(f"Filtering for 'scaling' tests (include_hybrid={include_hybrid})...")
-    df_scaling = df[df['test_type'] == 'scaling'].copy()
-    
-    if not include_hybrid:
-        df_scaling = df_scaling[df_scaling['implementation'] != 'hybrid']
-
-    implementations_to_process = df_scaling['implementation'].unique()
-    
-    best_results = []
-    if 'mpi' in implementations_to_process:
-        mpi_best = df_scaling[df_scaling['implementation'] == 'mpi'].copy()
-        if not mpi_best.empty:
-            best_results.append(mpi_best.loc[mpi_best.groupby(['puzzle_name', 'num_processors'])['solving_time'].idxmin()])
-
-    if 'omp' in implementations_to_process:
-        omp_best = df_scaling[df_scaling['implementation'] == 'omp'].copy()
-        if not omp_best.empty:
-            best_results.append(omp_best.loc[omp_best.groupby(['puzzle_name', 'num_threads'])['solving_time'].idxmin()])
-            
-    if 'hybrid' in implementations_to_process and include_hybrid:
-        hybrid_best = df_scaling[df_scaling['implementation'] == 'hybrid'].copy()
-        if not hybrid_best.empty:
-            best_results.append(hybrid_best.loc[hybrid_best.groupby(['puzzle_name', 'num_processors', 'num_threads'])['solving_time'].idxmin()])
-
-    if not best_results:
+    df_scaling = df[df['test_type'] == 'scaling']
+    implementations = ['mpi', 'omp', 'hybrid'] if include_hybrid else ['mpi', 'omp']
+    df_scaling = df_scaling[df_scaling['implementation'].isin(implementations)]
+
+    # A configuration is the process count for MPI, the thread count for OMP and both for hybrid;
+    # unused counts are zeroed, and rows missing a used count are dropped as groupby would
+    impl = df_scaling['implementation']
+    configs = df_scaling.assign(
+        _procs=df_scaling['num_processors'].where(impl != 'omp', 0),
+        _threads=df_scaling['num_threads'].where(impl != 'mpi', 0)
+    ).dropna(subset=['_procs', '_threads'])
+
+    # One groupby over every implementation keeps the fastest run per configuration
+    best_idx = configs.groupby(
+        ['implementation', 'puzzle_name', '_procs', '_threads'], sort=False, observed=True
+    )['solving_time'].idxmin()
+    if best_idx.empty:
         return pd.DataFrame()
 
-    return pd.concat(best_results).sort_index()
+    # A mask over the input keeps its row order and columns, so no reordering or helper cleanup is needed
+    return df_scaling[df_scaling.index.isin(best_idx)]
 
-def _add_computational_units(df):
-    """Helper function to add a 'computational_units' column."""
-    df_copy = df.copy()
-    choices = [
-        df_copy['num_processors'] * df_copy['num_threads'],
-        df_copy['num_processors'],
-        df_copy['num_threads']
-    ]
-    conditions = [
-        (df_copy['implementation'] == 'hybrid'),
-        (df_copy['implementation'] == 'mpi'),
-        (df_copy['implementation'] == 'omp')
-    ]
-    df_copy['computational_units'] = np.select(conditions, choices, default=1)
-    return df_copy
-
-
-def get_hybrid_config_type(row):
-    """Helper to classify hybrid configurations."""
-    if row['num_processors'] > row['num_threads']:
-        return 'MPI-heavy'
-    elif row['num_threads'] > row['num_processors']:
-        return 'OMP-heavy'
-    elif row['num_processors'] == row['num_threads']:
-        return 'Balanced'
-    return 'Other'
-
-def plot_hybrid_configuration_comparison(df_hybrid, df_seq):
-    """Plots a comparison of hybrid configuration solving times against the sequential baseline."""
+
+def get_hybrid_config_types(df):
+    """Classifies every hybrid configuration at once; rows with a missing count are 'Other'."""
+    procs, threads = df['num_processors'].to_numpy(), df['num_threads'].to_numpy()
+    return np.select(
+        [procs > threads, threads > procs, procs == threads],
+        ['MPI-heavy', 'OMP-heavy', 'Balanced'],
+        default='Other'
+    )
+
+def _split_by_puzzle(df):
+    """Splits df into a {puzzle_name: rows} dict once, so the plots sharing it iterate a plain dict."""
+    return dict(iter(df.groupby('puzzle_name', observed=True)))
+
+def _prepare_comparison_results(df):
+    """Splits the MPI/OMP comparison data per puzzle, once for all comparison plots."""
+    return _split_by_puzzle(df)
+
+def _prepare_hybrid_results(df_hybrid):
+    """Adds the configuration type shared by all hybrid plots and splits them per puzzle, once rather than per plot."""
+    df_hybrid['config_type'] = get_hybrid_config_types(df_hybrid)
+    return _split_by_puzzle(df_hybrid)
+
+
+# Line colours shared by every figure; a missing implementation falls back to the colour cycle
+IMPLEMENTATION_COLORS = {'mpi': 'C0', 'omp': 'orange'}
+CONFIG_TYPE_COLORS = {'MPI-heavy': 'darkblue', 'OMP-heavy': '#FF4500', 'Balanced': 'green'}
+
+@functools.cache
+def _shared_figure():
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    return fig, fig.add_subplot()
+
+def _reset_figure():
+    """
+    Returns this process's figure and axes, cleared for the next plot. A process renders one
+    figure at a time, so a single figure is reused instead of building and closing one per PDF.
+    """
+    fig, ax = _shared_figure()
+    ax.clear()
+    # clear() keeps the previous data limits, which axhline would otherwise extend; reset them
+    ax.relim()
+    return fig, ax
+
+def _render_now(render, *args):
+    """Default submit for the plot functions: renders the figure in this process."""
+    render(*args)
+
+def _ideal_range(units):
+    """
+    Sample points for the Ideal Speedup reference line over the range of units. The axes are
+    linear, so the straight line y = x only needs its two end points.
+    """
+    units = units.to_numpy(dtype=float)
+    return np.linspace(units.min(), units.max(), 2)
+
+@functools.cache
+def _puzzle_names(puzzle):
+    """Title name and output file stem of a puzzle path, derived once per puzzle in each process."""
+    name = os.path.basename(puzzle)
+    return name, name.replace(".txt", "")
+
+def _with_task_factor(title, puzzle_df):
+    """Appends the task factor to a figure title when all of the puzzle's runs share one."""
+    unique_factors = puzzle_df['task_factor'].dropna().unique()
+    if len(unique_factors) == 1:
+        title += f' (Factor={unique_factors[0]:g})'
+    return title
+
+def _seq_time(df_seq, puzzle):
+    """Sequential baseline solving time for a puzzle, or None when there is none."""
+    seq_time_row = df_seq[df_seq['puzzle_name'] == puzzle]
+    return None if seq_time_row.empty else seq_time_row['solving_time'].iloc[0]
+
+# Each plot_* function below groups its data by puzzle and hands every figure, as a
+# per-puzzle _render_* function and its arguments, to submit. The figures are independent,
+# so main passes a submit that renders them in a process pool.
+
+def _render_hybrid_configuration_comparison(puzzle, puzzle_df, seq_time):
+    name, stem = _puzzle_names(puzzle)
+    fig, ax = _reset_figure()
+    if seq_time is not None:
+        ax.axhline(y=seq_time, color='r', linestyle='--', label='Sequential', zorder=1)
+    for config_type, group_df in puzzle_df.groupby('config_type', observed=True):
+        if config_type in CONFIG_TYPE_COLORS:
+            ax.plot(group_df['computational_units'].to_numpy(), group_df['solving_time'].to_numpy(), marker='o', linestyle='-', label=config_type, color=CONFIG_TYPE_COLORS[config_type], zorder=2)
+    
+    # --- MODIFICATION: Add task factor to title ---
+    title = f'Hybrid Configurations: {name}'
+    unique_factors = puzzle_df['task_factor'].dropna().unique()
+    if len(unique_factors) == 1:
+        factor = unique_factors[0]
+        factor_str = f'{factor:g}'
+        title += f' (Factor={factor_str} {factor_str})'
+    ax.set_title(title)
+
+    ax.set_xlabel('Total Computational Units (Cores)')
+    ax.set_ylabel('Solving Time (s)')
+    ax.set_xscale('log', base=2)
+    units = np.unique(puzzle_df['computational_units'].to_numpy())
+    ax.set_xticks(units, labels=units)
+    ax.grid(True, which='both', linestyle='--')
+    ax.legend()
+    fig.savefig(output_folder / f'solving_time_hybrid_{stem}.pdf')
+
+def plot_hybrid_configuration_comparison(puzzle_groups, df_seq, submit=_render_now):
+    """Plots hybrid configuration solving times against the sequential baseline (see _prepare_hybrid_results)."""
     print("Generating hybrid configuration comparison plots...")
-    if df_hybrid.empty: return
+    for puzzle, puzzle_df in puzzle_groups.items():
+        submit(_render_hybrid_configuration_comparison, puzzle, puzzle_df, _seq_time(df_seq, puzzle))
+
+def _render_hybrid_speedup_comparison(puzzle, puzzle_df):
+    name, stem = _puzzle_names(puzzle)
+    fig, ax = _reset_figure()
+    all_units = puzzle_df['computational_units'].dropna()
+    if not all_units.empty:
+        ideal_range = _ideal_range(all_units)
+        ax.plot(ideal_range, ideal_range, color='red', linestyle='--', label='Ideal Speedup', zorder=1)
+    for config_type, group_df in puzzle_df.groupby('config_type', observed=True):
+        if config_type in CONFIG_TYPE_COLORS:
+            sorted_group = group_df.dropna(subset=['speedup'])
+            if not sorted_group.empty:
+                ax.plot(sorted_group['computational_units'].to_numpy(), sorted_group['speedup'].to_numpy(), marker='o', linestyle='-', label=config_type, color=CONFIG_TYPE_COLORS[config_type], zorder=2)
     
-    df_hybrid = _add_computational_units(df_hybrid)
-    df_hybrid['config_type'] = df_hybrid.apply(get_hybrid_config_type, axis=1)
-    color_map = {'MPI-heavy': 'darkblue', 'OMP-heavy': '#FF4500', 'Balanced': 'green'}
-    for puzzle, puzzle_df in df_hybrid.groupby('puzzle_name'):
-        fig, ax = plt.subplots()
-        seq_time_row = df_seq[df_seq['puzzle_name'] == puzzle]
-        if not seq_time_row.empty:
-            seq_time = seq_time_row['solving_time'].iloc[0]
-            ax.axhline(y=seq_time, color='r', linestyle='--', label='Sequential', zorder=1)
-        for config_type, group_df in puzzle_df.groupby('config_type'):
-            if config_type in color_map:
-                sorted_group = group_df.sort_values('computational_units')
-                ax.plot(sorted_group['computational_units'], sorted_group['solving_time'], marker='o', linestyle='-', label=config_type, color=color_map.get(config_type), zorder=2)
-        
-        # --- MODIFICATION: Add task factor to title ---
-        title = f'Hybrid Configurations: {os.path.basename(puzzle)}'
-        unique_factors = puzzle_df['task_factor'].dropna().unique()
-        if len(unique_factors) == 1:
-            factor = unique_factors[0]
-            factor_str = f'{factor:g}'
-            title += f' (Factor={factor_str} {factor_str})'
-        ax.set_title(title)
-
-        ax.set_xlabel('Total Computational Units (Cores)')
-        ax.set_ylabel('Solving Time (s)')
-        ax.set_xscale('log', base=2)
-        ax.set_xticks(sorted(puzzle_df['computational_units'].unique()), labels=sorted(puzzle_df['computational_units'].unique()))
-        ax.grid(True, which='both', linestyle='--')
-        ax.legend()
-        plt.savefig(output_folder / f'solving_time_hybrid_{os.path.basename(puzzle).replace(".txt", "")}.pdf')
-        plt.close(fig)
-
-def plot_hybrid_speedup_comparison(df_hybrid):
-    """Plots a comparison of speedup for different hybrid configurations."""
+    # --- MODIFICATION: Add task factor to title ---
+    title = f'Hybrid Speedup: {name}'
+    unique_factors = puzzle_df['task_factor'].dropna().unique()
+    if len(unique_factors) == 1:
+        factor = unique_factors[0]
+        factor_str = f'{factor:g}'
+        title += f' (Factor={factor_str} {factor_str})'
+    ax.set_title(title)
+
+    ax.set_xlabel('Total Computational Units (Cores)')
+    ax.set_ylabel('Speedup')
+    ax.grid(True, which='both', linestyle='--')
+    ax.legend()
+    fig.savefig(output_folder / f'speedup_hybrid_{stem}.pdf')
+
+def plot_hybrid_speedup_comparison(puzzle_groups, submit=_render_now):
+    """Plots a comparison of speedup for different hybrid configurations (see _prepare_hybrid_results)."""
     print("Generating hybrid speedup comparison plots...")
-    if df_hybrid.empty: return
-    df_hybrid = _add_computational_units(df_hybrid)
-    df_hybrid['config_type'] = df_hybrid.apply(get_hybrid_config_type, axis=1)
-    color_map = {'MPI-heavy': 'darkblue', 'OMP-heavy': '#FF4500', 'Balanced': 'green'}
-    for puzzle, puzzle_df in df_hybrid.groupby('puzzle_name'):
-        fig, ax = plt.subplots()
-        all_units = puzzle_df['computational_units'].dropna()
-        if not all_units.empty:
-            ideal_range = np.linspace(min(all_units), max(all_units), 100)
-            ax.plot(ideal_range, ideal_range, color='red', linestyle='--', label='Ideal Speedup', zorder=1)
-        for config_type, group_df in puzzle_df.groupby('config_type'):
-            if config_type in color_map:
-                sorted_group = group_df.sort_values('computational_units').dropna(subset=['speedup'])
-                if not sorted_group.empty:
-                    ax.plot(sorted_group['computational_units'], sorted_group['speedup'], marker='o', linestyle='-', label=config_type, color=color_map.get(config_type), zorder=2)
-        
-        # --- MODIFICATION: Add task factor to title ---
-        title = f'Hybrid Speedup: {os.path.basename(puzzle)}'
-        unique_factors = puzzle_df['task_factor'].dropna().unique()
-        if len(unique_factors) == 1:
-            factor = unique_factors[0]
-            factor_str = f'{factor:g}'
-            title += f' (Factor={factor_str} {factor_str})'
-        ax.set_title(title)
-
-        ax.set_xlabel('Total Computational Units (Cores)')
-        ax.set_ylabel('Speedup')
-        ax.grid(True, which='both', linestyle='--')
-        ax.legend()
-        plt.savefig(output_folder / f'speedup_hybrid_{os.path.basename(puzzle).replace(".txt", "")}.pdf')
-        plt.close(fig)
-
-def plot_hybrid_efficiency_comparison(df_hybrid):
-    """Plots a comparison of efficiency for different hybrid configurations."""
+    for puzzle, puzzle_df in puzzle_groups.items():
+        submit(_render_hybrid_speedup_comparison, puzzle, puzzle_df)
+
+def _render_hybrid_efficiency_comparison(puzzle, puzzle_df):
+    name, stem = _puzzle_names(puzzle)
+    fig, ax = _reset_figure()
+    for config_type, group_df in puzzle_df.groupby('config_type', observed=True):
+        if config_type in CONFIG_TYPE_COLORS:
+            sorted_group = group_df.dropna(subset=['efficiency'])
+            if not sorted_group.empty:
+                ax.plot(sorted_group['computational_units'].to_numpy(), sorted_group['efficiency'].to_numpy(), marker='o', linestyle='-', label=config_type, color=CONFIG_TYPE_COLORS[config_type])
+    
+    # --- MODIFICATION: Add task factor to title ---
+    title = f'Hybrid Efficiency: {name}'
+    unique_factors = puzzle_df['task_factor'].dropna().unique()
+    if len(unique_factors) == 1:
+        factor = unique_factors[0]
+        factor_str = f'{factor:g}'
+        title += f' (Factor={factor_str} {factor_str})'
+    ax.set_title(title)
+
+    ax.set_xlabel('Total Computational Units (Cores)')
+    ax.set_ylabel('Efficiency')
+    ax.set_xscale('log', base=2)
+    units = np.unique(puzzle_df['computational_units'].to_numpy())
+    ax.set_xticks(units, labels=units)
+    ax.grid(True, which='both', linestyle='--')
+    ax.legend()
+    fig.savefig(output_folder / f'efficiency_hybrid_{stem}.pdf')
+
+def plot_hybrid_efficiency_comparison(puzzle_groups, submit=_render_now):
+    """Plots a comparison of efficiency for different hybrid configurations (see _prepare_hybrid_results)."""
     print("Generating hybrid efficiency comparison plots...")
-    if df_hybrid.empty: return
-    df_hybrid = _add_computational_units(df_hybrid)
-    df_hybrid['config_type'] = df_hybrid.apply(get_hybrid_config_type, axis=1)
-    color_map = {'MPI-heavy': 'darkblue', 'OMP-heavy': '#FF4500', 'Balanced': 'green'}
-    for puzzle, puzzle_df in df_hybrid.groupby('puzzle_name'):
-        fig, ax = plt.subplots()
-        for config_type, group_df in puzzle_df.groupby('config_type'):
-            if config_type in color_map:
-                sorted_group = group_df.sort_values('computational_units').dropna(subset=['efficiency'])
-                if not sorted_group.empty:
-                    ax.plot(sorted_group['computational_units'], sorted_group['efficiency'], marker='o', linestyle='-', label=config_type, color=color_map.get(config_type))
-        
-        # --- MODIFICATION: Add task factor to title ---
-        title = f'Hybrid Efficiency: {os.path.basename(puzzle)}'
-        unique_factors = puzzle_df['task_factor'].dropna().unique()
-        if len(unique_factors) == 1:
-            factor = unique_factors[0]
-            factor_str = f'{factor:g}'
-            title += f' (Factor={factor_str} {factor_str})'
-        ax.set_title(title)
-
-        ax.set_xlabel('Total Computational Units (Cores)')
-        ax.set_ylabel('Efficiency')
-        ax.set_xscale('log', base=2)
-        ax.set_xticks(sorted(puzzle_df['computational_units'].unique()), labels=sorted(puzzle_df['computational_units'].unique()))
-        ax.grid(True, which='both', linestyle='--')
-        ax.legend()
-        plt.savefig(output_folder / f'efficiency_hybrid_{os.path.basename(puzzle).replace(".txt", "")}.pdf')
-        plt.close(fig)
-
-def plot_comparison_efficiency(df):
-    """Plots a comparison of efficiency vs. total computational units (MPI and OMP)."""
+    for puzzle, puzzle_df in puzzle_groups.items():
+        submit(_render_hybrid_efficiency_comparison, puzzle, puzzle_df)
+
+def _render_comparison_efficiency(puzzle, puzzle_df):
+    name, stem = _puzzle_names(puzzle)
+    fig, ax = _reset_figure()
+    for impl, impl_df in puzzle_df.groupby('implementation', observed=True):
+        ax.plot(impl_df['computational_units'].to_numpy(), impl_df['efficiency'].to_numpy(), marker='o', linestyle='-', label=impl.upper(), color=IMPLEMENTATION_COLORS.get(impl))
+    
+    ax.set_title(_with_task_factor(f'Efficiency: {name}', puzzle_df))
+
+    ax.set_xlabel('Total Computational Units (Cores)')
+    ax.set_ylabel('Efficiency')
+    ax.set_xscale('log', base=2)
+    units = np.unique(puzzle_df['computational_units'].to_numpy())
+    ax.set_xticks(units, labels=units)
+    ax.grid(True, which='both', linestyle='--')
+    ax.legend()
+    fig.savefig(output_folder / f'efficiency_mpi_omp_{stem}.pdf')
+
+def plot_comparison_efficiency(puzzle_groups, submit=_render_now):
+    """Plots a comparison of efficiency vs. total computational units, MPI and OMP (see _prepare_comparison_results)."""
     print("Generating comparison plots for efficiency...")
-    df_with_units = _add_computational_units(df)
-    color_map = {'mpi': 'C0', 'omp': 'orange'} 
-    for puzzle, puzzle_df in df_with_units.groupby('puzzle_name'):
-        plt.figure()
-        for impl, impl_df in puzzle_df.groupby('implementation'):
-            sorted_df = impl_df.sort_values('computational_units')
-            if not sorted_df.empty:
-                plt.plot(sorted_df['computational_units'], sorted_df['efficiency'], marker='o', linestyle='-', label=impl.upper(), color=color_map.get(impl))
-        
-        title = f'Efficiency: {os.path.basename(puzzle)}'
-        unique_factors = puzzle_df['task_factor'].dropna().unique()
-        if len(unique_factors) == 1:
-            factor_str = f'{unique_factors[0]:g}'
-            title += f' (Factor={factor_str})'
-        plt.title(title)
-
-        plt.xlabel('Total Computational Units (Cores)')
-        plt.ylabel('Efficiency')
-        plt.xscale('log', base=2)
-        plt.xticks(sorted(puzzle_df['computational_units'].unique()), labels=sorted(puzzle_df['computational_units'].unique()))
-        plt.grid(True, which='both', linestyle='--')
-        plt.legend()
-        plt.savefig(output_folder / f'efficiency_mpi_omp_{os.path.basename(puzzle).replace(".txt", "")}.pdf')
-        plt.close()
-
-def plot_all_factor_analyses(df_factor):
+    for puzzle, puzzle_df in puzzle_groups.items():
+        submit(_render_comparison_efficiency, puzzle, puzzle_df)
+
+# Per implementation: the columns that split a factor figure into lines, the line label
+# (formatted with the integer counts), title prefix, x label and legend title
+FACTOR_LAYOUTS = {
+    'mpi': (['num_processors'], '{0} Procs', 'MPI', 'Task Factor', 'Processes'),
+    'omp': (['num_threads'], '{0} Threads', 'OMP', 'Task Factor', 'Threads'),
+    'hybrid': (['num_processors', 'num_threads'], '{0}p x {1}t', 'Hybrid',
+               'Symmetric Task Factor (MPI factor = OpenMP factor)', 'Config'),
+}
+
+def _render_factor_analysis(impl_type, puzzle, puzzle_df):
+    name, stem = _puzzle_names(puzzle)
+    fig, ax = _reset_figure()
+    line_columns, line_label, title, xlabel, legend_title = FACTOR_LAYOUTS[impl_type]
+    
+    for counts, group in puzzle_df.groupby(line_columns, observed=True):
+        ax.plot(group['task_factor'].to_numpy(), group['solving_time'].to_numpy(), marker='o', linestyle='-', label=line_label.format(*map(int, counts)))
+    ax.set_title(f'{title} Time vs. Task Factor: {name}')
+    ax.set_xlabel(xlabel)
+    ax.legend(title=legend_title)
+    filename = f'factor_{impl_type}_{stem}.pdf'
+    
+    ax.set_ylabel('Solving Time (s)')
+    ax.set_xscale('log', base=2)
+    ax.grid(True, which='both', linestyle='--')
+    
+    if 'task_factor' in puzzle_df.columns:
+        factor_values = np.unique(puzzle_df['task_factor'].to_numpy())
+        ax.set_xticks(factor_values, labels=[str(int(f)) if f.is_integer() else str(f) for f in factor_values])
+    
+    fig.savefig(output_folder / filename)
+
+def plot_all_factor_analyses(df_factor, submit=_render_now):
     """
     Plots Solving Time vs. Task Factor for MPI, OpenMP, and Hybrid implementations.
     """
@@ -268,128 +404,87 @@ def plot_all_factor_analyses(df_factor):
         return
         
     print("Generating all Task Factor analysis plots...")
-
-    for impl_type, impl_df in df_factor.groupby('implementation'):
-        for puzzle, puzzle_df in impl_df.groupby('puzzle_name'):
-            plt.figure()
-            
-            if impl_type == 'mpi':
-                for procs, group in puzzle_df.groupby('num_processors'):
-                    group = group.sort_values('task_factor')
-                    plt.plot(group['task_factor'], group['solving_time'], marker='o', linestyle='-', label=f'{int(procs)} Procs')
-                plt.title(f'MPI Time vs. Task Factor: {os.path.basename(puzzle)}')
-                plt.xlabel('Task Factor')
-                plt.legend(title="Processes")
-                filename = f'factor_mpi_{os.path.basename(puzzle).replace(".txt", "")}.pdf'
-
-            elif impl_type == 'omp':
-                for threads, group in puzzle_df.groupby('num_threads'):
-                    group = group.sort_values('task_factor')
-                    plt.plot(group['task_factor'], group['solving_time'], marker='o', linestyle='-', label=f'{int(threads)} Threads')
-                plt.title(f'OMP Time vs. Task Factor: {os.path.basename(puzzle)}')
-                plt.xlabel('Task Factor')
-                plt.legend(title="Threads")
-                filename = f'factor_omp_{os.path.basename(puzzle).replace(".txt", "")}.pdf'
-
-            elif impl_type == 'hybrid':
-                for (procs, threads), group in puzzle_df.groupby(['num_processors', 'num_threads']):
-                    group = group.sort_values('task_factor')
-                    plt.plot(group['task_factor'], group['solving_time'], marker='o', linestyle='-', label=f'{int(procs)}p x {int(threads)}t')
-                plt.title(f'Hybrid Time vs. Task Factor: {os.path.basename(puzzle)}')
-                plt.xlabel('Symmetric Task Factor (MPI factor = OpenMP factor)')
-                plt.legend(title="Config")
-                filename = f'factor_hybrid_{os.path.basename(puzzle).replace(".txt", "")}.pdf'
-            
-            plt.ylabel('Solving Time (s)')
-            plt.xscale('log', base=2)
-            plt.grid(True, which='both', linestyle='--')
-            
-            if 'task_factor' in puzzle_df.columns:
-                factor_values = sorted(puzzle_df['task_factor'].unique())
-                plt.xticks(factor_values, labels=[str(int(f)) if f.is_integer() else str(f) for f in factor_values])
-            
-            plt.savefig(output_folder / filename)
-            plt.close()
-
-def plot_comparison_solving_time(df, df_seq):
-    """Plots a comparison of solving time vs. total computational units (MPI and OMP)."""
+    # Only implementations with a layout get a figure. Sorted once by factor, so every
+    # configuration's line comes out sorted
+    df_factor = df_factor[df_factor['implementation'].isin(FACTOR_LAYOUTS)]
+    df_factor = df_factor.sort_values('task_factor', kind='stable')
+
+    for (impl_type, puzzle), puzzle_df in df_factor.groupby(['implementation', 'puzzle_name'], observed=True):
+        submit(_render_factor_analysis, impl_type, puzzle, puzzle_df)
+
+def _render_comparison_solving_time(puzzle, puzzle_df, seq_time):
+    name, stem = _puzzle_names(puzzle)
+    fig, ax = _reset_figure()
+    if seq_time is not None:
+        ax.axhline(y=seq_time, color='r', linestyle='--', label='Sequential', zorder=1)
+    for impl, impl_df in puzzle_df.groupby('implementation', observed=True):
+        ax.plot(impl_df['computational_units'].to_numpy(), impl_df['solving_time'].to_numpy(), marker='o', linestyle='-', label=impl.upper(), color=IMPLEMENTATION_COLORS.get(impl), zorder=2)
+    
+    ax.set_title(_with_task_factor(f'Solving Time: {name}', puzzle_df))
+    
+    ax.set_xlabel('Total Computational Units (Cores)')
+    ax.set_ylabel('Solving Time (s)')
+    ax.set_xscale('log', base=2)
+    units = np.unique(puzzle_df['computational_units'].to_numpy())
+    ax.set_xticks(units, labels=units)
+    ax.grid(True, which='both', linestyle='--')
+    ax.legend()
+    fig.savefig(output_folder / f'solving_time_mpi_omp_{stem}.pdf')
+
+def plot_comparison_solving_time(puzzle_groups, df_seq, submit=_render_now):
+    """Plots a comparison of solving time vs. total computational units, MPI and OMP (see _prepare_comparison_results)."""
     print("Generating comparison plots for solving time...")
-    df_with_units = _add_computational_units(df)
-    color_map = {'mpi': 'C0', 'omp': 'orange'}
-    for puzzle, puzzle_df in df_with_units.groupby('puzzle_name'):
-        plt.figure()
-        seq_time_row = df_seq[df_seq['puzzle_name'] == puzzle]
-        if not seq_time_row.empty:
-            seq_time = seq_time_row['solving_time'].iloc[0]
-            plt.axhline(y=seq_time, color='r', linestyle='--', label='Sequential', zorder=1)
-        for impl, impl_df in puzzle_df.groupby('implementation'):
-            sorted_df = impl_df.sort_values('computational_units')
-            if not sorted_df.empty:
-                plt.plot(sorted_df['computational_units'], sorted_df['solving_time'], marker='o', linestyle='-', label=impl.upper(), color=color_map.get(impl), zorder=2)
-        
-        title = f'Solving Time: {os.path.basename(puzzle)}'
-        unique_factors = puzzle_df['task_factor'].dropna().unique()
-        if len(unique_factors) == 1:
-            factor_str = f'{unique_factors[0]:g}'
-            title += f' (Factor={factor_str})'
-        plt.title(title)
-        
-        plt.xlabel('Total Computational Units (Cores)')
-        plt.ylabel('Solving Time (s)')
-        plt.xscale('log', base=2)
-        plt.xticks(sorted(puzzle_df['computational_units'].unique()), labels=sorted(puzzle_df['computational_units'].unique()))
-        plt.grid(True, which='both', linestyle='--')
-        plt.legend()
-        plt.savefig(output_folder / f'solving_time_mpi_omp_{os.path.basename(puzzle).replace(".txt", "")}.pdf')
-        plt.close()
-
-def plot_comparison_speedup(df):
-    """Plots a comparison of speedup vs. total computational units (MPI and OMP)."""
+    for puzzle, puzzle_df in puzzle_groups.items():
+        submit(_render_comparison_solving_time, puzzle, puzzle_df, _seq_time(df_seq, puzzle))
+
+def _render_comparison_speedup(puzzle, puzzle_df):
+    name, stem = _puzzle_names(puzzle)
+    fig, ax = _reset_figure()
+    for impl, impl_df in puzzle_df.groupby('implementation', observed=True):
+        sorted_df = impl_df.dropna(subset=['speedup'])
+        ax.plot(sorted_df['computational_units'].to_numpy(), sorted_df['speedup'].to_numpy(), marker='o', linestyle='-', label=f'{impl.upper()} Speedup', color=IMPLEMENTATION_COLORS.get(impl), zorder=2)
+    if not puzzle_df.dropna(subset=['speedup', 'computational_units']).empty:
+        all_units = puzzle_df['computational_units'].dropna()
+        ideal_range = _ideal_range(all_units)
+        ax.plot(ideal_range, ideal_range, color='red', linestyle='--', label='Ideal Speedup', zorder=1)
+    
+    ax.set_title(_with_task_factor(f'Speedup: {name}', puzzle_df))
+    
+    ax.set_xlabel('Total Computational Units (Cores)')
+    ax.set_ylabel('Speedup')
+    ax.grid(True, which='both', linestyle='--')
+    ax.legend()
+    fig.savefig(output_folder / f'speedup_mpi_omp_{stem}.pdf')
+
+def plot_comparison_speedup(puzzle_groups, submit=_render_now):
+    """Plots a comparison of speedup vs. total computational units, MPI and OMP (see _prepare_comparison_results)."""
     print("Generating comparison plots for speedup...")
-    df_with_units = _add_computational_units(df)
-    color_map = {'mpi': 'C0', 'omp': 'orange'}
-    for puzzle, puzzle_df in df_with_units.groupby('puzzle_name'):
-        fig, ax = plt.subplots()
-        for impl, impl_df in puzzle_df.groupby('implementation'):
-            sorted_df = impl_df.sort_values('computational_units')
-            if not sorted_df.empty:
-                sorted_df.dropna(subset=['speedup'], inplace=True)
-                ax.plot(sorted_df['computational_units'], sorted_df['speedup'], marker='o', linestyle='-', label=f'{impl.upper()} Speedup', color=color_map.get(impl), zorder=2)
-        if not puzzle_df.dropna(subset=['speedup', 'computational_units']).empty:
-            all_units = puzzle_df['computational_units'].dropna()
-            ideal_range = np.linspace(min(all_units), max(all_units), 100)
-            ax.plot(ideal_range, ideal_range, color='red', linestyle='--', label='Ideal Speedup', zorder=1)
-        
-        title = f'Speedup: {os.path.basename(puzzle)}'
-        unique_factors = puzzle_df['task_factor'].dropna().unique()
-        if len(unique_factors) == 1:
-            factor_str = f'{unique_factors[0]:g}'
-            title += f' (Factor={factor_str})'
-        ax.set_title(title)
-        
-        ax.set_xlabel('Total Computational Units (Cores)')
-        ax.set_ylabel('Speedup')
-        ax.grid(True, which='both', linestyle='--')
-        ax.legend()
-        plt.savefig(output_folder / f'speedup_mpi_omp_{os.path.basename(puzzle).replace(".txt", "")}.pdf')
-        plt.close(fig)
-
-def main():
-    """Main function to read the CSV, create folders, and generate all plots."""
+    for puzzle, puzzle_df in puzzle_groups.items():
+        submit(_render_comparison_speedup, puzzle, puzzle_df)
+
+def main(workers=1):
+    """
+    Main function to read the CSV, create folders, and generate all plots.
+    With more than one worker the figures are rendered in a process pool.
+    """
     results_file = PROJECT_ROOT / 'results/results_dataset.csv'
     try:
-        df_raw = pd.read_csv(results_file)
+        df_raw = read_results_csv(results_file)
     except FileNotFoundError:
         print(f"Error: '{results_file}' not found. Please ensure the CSV file is present.")
         return
 
-    create_graphs_folder()
+    output_folder.mkdir(parents=True, exist_ok=True)
+    print(f"Ensured output folder exists: {output_folder}")
     
-    df_filtered = filter_by_job_id(df_raw)
-    df_cleaned = clean_data(df_filtered)
+    # Only the cleaned frame is kept, so the raw and filtered ones are freed before the pool forks
+    df_cleaned = clean_data(filter_by_job_id(df_raw))
+    del df_raw
     
     # --- Data Separation for Different Plotting Needs ---
-    df_scaling = df_cleaned[df_cleaned['test_type'] == 'scaling']
+    # Sorted once along the x axis for every scaling plot: the best-run selection and groupby
+    # both keep row order, so every plotted line comes out sorted
+    df_scaling = df_cleaned[df_cleaned['test_type'] == 'scaling'].sort_values('computational_units', kind='stable')
     df_factor = df_cleaned[df_cleaned['test_type'] == 'factor']
     
     df_scaling_comparison = get_best_scaling_results(df_scaling, include_hybrid=False)
@@ -398,31 +493,51 @@ def main():
         df_scaling_hybrid = df_scaling_hybrid[df_scaling_hybrid['implementation'] == 'hybrid']
     df_seq = df_cleaned[df_cleaned['implementation'] == 'seq'].copy()
     
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    futures = []
+    if executor is None:
+        submit = _render_now
+    else:
+        def submit(render, *args):
+            futures.append(executor.submit(render, *args))
+
     # --- Generate Scaling Plots ---
     if not df_scaling_comparison.empty:
         print("\n--- Generating MPI vs. OMP Comparison Plots ---")
-        plot_comparison_solving_time(df_scaling_comparison, df_seq)
-        plot_comparison_speedup(df_scaling_comparison)
-        plot_comparison_efficiency(df_scaling_comparison)
+        comparison_groups = _prepare_comparison_results(df_scaling_comparison)
+        plot_comparison_solving_time(comparison_groups, df_seq, submit)
+        plot_comparison_speedup(comparison_groups, submit)
+        plot_comparison_efficiency(comparison_groups, submit)
     else:
         print("\nNo valid data for MPI/OMP scaling comparison plots.")
 
     if not df_scaling_hybrid.empty:
         print("\n--- Generating Hybrid Configuration Analysis Plots ---")
+        hybrid_groups = _prepare_hybrid_results(df_scaling_hybrid)
         if not df_seq.empty:
-            plot_hybrid_configuration_comparison(df_scaling_hybrid, df_seq)
-        plot_hybrid_speedup_comparison(df_scaling_hybrid)
-        plot_hybrid_efficiency_comparison(df_scaling_hybrid)
+            plot_hybrid_configuration_comparison(hybrid_groups, df_seq, submit)
+        plot_hybrid_speedup_comparison(hybrid_groups, submit)
+        plot_hybrid_efficiency_comparison(hybrid_groups, submit)
     else:
         print("\nNo valid data for hybrid configuration plots.")
     
     # --- Generate Factor Plots ---
     if not df_factor.empty:
-        plot_all_factor_analyses(df_factor)
+        plot_all_factor_analyses(df_factor, submit)
     else:
         print("\nNo valid 'factor' data found. Skipping factor analysis plots.")
 
+    if executor is not None:
+        # Wait for all figures; result() re-raises any error from a worker
+        with executor:
+            for future in futures:
+                future.result()
+
     print(f"\nAll tasks complete. PDF plots have been generated in the '{output_folder}' folder.")
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Generate the scaling, hybrid and task factor plots from the results CSV.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Number of processes used to render the plots (default: CPU count).")
+    args = parser.parse_args()
+
+    main(workers=max(1, args.workers or 1))
\ No newline at end of file